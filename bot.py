@@ -2,10 +2,10 @@
 import os, sys, time, zipfile, smtplib, ssl, re
 from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from email.message import EmailMessage
 
-import pandas as pd  # keep installed even if not used yet
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
 
 # ----------------- Config via env / GitHub Secrets -----------------
@@ -25,6 +25,20 @@ DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 IST = ZoneInfo("Asia/Kolkata")
 
+DATE_FORMATS = {
+    "yyyy_mm_dd":      "%Y-%m-%d",
+    "dd_mmm_yyyy":     "%d-%b-%Y",
+    "dd_mm_yyyy":      "%d/%m/%Y",
+    "dd_mm_yyyy_dash": "%d-%m-%Y",
+}
+
 # ----------------- Helpers -----------------
 def yesterday_ist_formats():
-    y = datetime.now(IST) - time
+    """Return a formatter for yesterday (IST); each format is built on first use only."""
+    y = datetime.now(IST) - timedelta(days=1)
+
+    @lru_cache(maxsize=None)
+    def fmt(key):
+        return y.strftime(DATE_FORMATS[key])
+
+    return fmt